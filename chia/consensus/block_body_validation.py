@@ -27,7 +27,7 @@ from chia.types.condition_with_args import ConditionWithArgs
 from chia.types.full_block import FullBlock, additions_for_npc, announcements_for_npc
 from chia.types.name_puzzle_condition import NPC
 from chia.types.unfinished_block import UnfinishedBlock
-from chia.util.condition_tools import pkm_pairs_for_conditions_dict
+from chia.util.condition_tools import pks_msgs_for_conditions_dict
 from chia.util.errors import Err
 from chia.util.hash import std_hash
 from chia.util.ints import uint32, uint64
@@ -196,10 +196,13 @@ async def validate_block_body(
             return Err.INVALID_BLOCK_COST, None
 
         additions_dic: Dict[bytes32, Coin] = {}
+        addition_names: List[bytes32] = []
         # 10. Check additions for max coin amount
         # Be careful to check for 64 bit overflows in other languages. This is the max 64 bit unsigned integer
         for coin in additions + coinbase_additions:
-            additions_dic[coin.name()] = coin
+            coin_name = coin.name()
+            addition_names.append(coin_name)
+            additions_dic[coin_name] = coin
             if coin.amount > constants.MAX_COIN_AMOUNT:
                 return Err.COIN_AMOUNT_EXCEEDS_MAXIMUM, None
 
@@ -229,7 +232,7 @@ async def validate_block_body(
             return Err.INVALID_TRANSACTIONS_FILTER_HASH, None
 
         # 13. Check for duplicate outputs in additions
-        addition_counter = collections.Counter(_.name() for _ in additions + coinbase_additions)
+        addition_counter = collections.Counter(addition_names)
         for k, v in addition_counter.items():
             if v > 1:
                 return Err.DUPLICATE_OUTPUT, None
@@ -380,9 +383,9 @@ async def validate_block_body(
             )
             if error:
                 return error, None
-            for pk, m in pkm_pairs_for_conditions_dict(npc.condition_dict, npc.coin_name):
-                pairs_pks.append(pk)
-                pairs_msgs.append(m)
+            npc_pks, npc_msgs = pks_msgs_for_conditions_dict(npc.condition_dict, npc.coin_name)
+            pairs_pks.extend(npc_pks)
+            pairs_msgs.extend(npc_msgs)
 
         # 22. Verify aggregated signature
         # TODO: move this to pre_validate_blocks_multiprocessing so we can sync faster
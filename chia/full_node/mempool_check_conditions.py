@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Tuple
 from chia.types.blockchain_format.program import SerializedProgram
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.coin_record import CoinRecord
+from chia.types.condition_opcodes import OPCODE_TABLE
 from chia.types.condition_with_args import ConditionWithArgs
 from chia.types.name_puzzle_condition import NPC
 from chia.util.clvm import int_from_bytes
@@ -139,30 +140,23 @@ def get_name_puzzle_conditions(
         else:
             cost, result = GENERATOR_MOD.run_with_cost(block_program, block_program_args)
         npc_list = []
-        opcodes = set(item.value for item in ConditionOpcode)
         for res in result.as_iter():
             conditions_list = []
-            name = std_hash(
-                bytes(
-                    res.first().first().as_atom()
-                    + res.first().rest().first().as_atom()
-                    + res.first().rest().rest().first().as_atom()
-                )
-            )
-            puzzle_hash = bytes32(res.first().rest().first().as_atom())
+            # Read the (parent_id puzzle_hash amount) atoms in one walk, instead of re-traversing from the
+            # head of the list with first()/rest() for each of them
+            parent_id, puzzle_hash_atom, amount = res.first().as_atom_list()[:3]
+            name = std_hash(bytes(parent_id + puzzle_hash_atom + amount))
+            puzzle_hash = bytes32(puzzle_hash_atom)
             for cond in res.rest().first().as_iter():
-                if cond.first().as_atom() in opcodes:
-                    opcode = ConditionOpcode(cond.first().as_atom())
-                elif not safe_mode:
+                opcode = OPCODE_TABLE.get(cond.first().as_atom())
+                if opcode is None:
+                    if safe_mode:
+                        return "Unknown operator in safe mode.", None, None
                     opcode = ConditionOpcode.UNKNOWN
-                else:
-                    return "Unknown operator in safe mode.", None, None
                 cvl = ConditionWithArgs(opcode, cond.rest().as_atom_list())
                 conditions_list.append(cvl)
             conditions_dict = conditions_by_opcode(conditions_list)
-            if conditions_dict is None:
-                conditions_dict = {}
-            npc_list.append(NPC(name, puzzle_hash, [(a, b) for a, b in conditions_dict.items()]))
+            npc_list.append(NPC(name, puzzle_hash, list(conditions_dict.items())))
         return None, npc_list, uint64(cost)
     except Exception:
         tb = traceback.format_exc()
@@ -26,7 +26,7 @@ from chia.types.mempool_inclusion_status import MempoolInclusionStatus
 from chia.types.mempool_item import MempoolItem
 from chia.types.spend_bundle import SpendBundle
 from chia.util.clvm import int_from_bytes
-from chia.util.condition_tools import pkm_pairs_for_conditions_dict, announcements_names_for_npc
+from chia.util.condition_tools import pks_msgs_for_conditions_dict, announcements_names_for_npc
 from chia.util.errors import Err
 from chia.util.ints import uint32, uint64
 from chia.util.streamable import dataclass_from_dict, recurse_jsonify
@@ -190,10 +190,10 @@ class MempoolManager:
         removal_names: List[bytes32] = new_spend.removal_names()
 
         additions = additions_for_npc(npc_list)
+        # Coin names are hashes, compute them once and reuse them for the duplicate check below
+        addition_names: List[bytes32] = [add.name() for add in additions]
 
-        additions_dict: Dict[bytes32, Coin] = {}
-        for add in additions:
-            additions_dict[add.name()] = add
+        additions_dict: Dict[bytes32, Coin] = dict(zip(addition_names, additions))
 
         addition_amount = uint64(0)
         # Check additions for max coin amount
@@ -206,7 +206,7 @@ class MempoolManager:
                 )
             addition_amount = uint64(addition_amount + coin.amount)
         # Check for duplicate outputs
-        addition_counter = collections.Counter(_.name() for _ in additions)
+        addition_counter = collections.Counter(addition_names)
         for k, v in addition_counter.items():
             if v > 1:
                 return None, MempoolInclusionStatus.FAILED, Err.DUPLICATE_OUTPUT
@@ -304,7 +304,7 @@ class MempoolManager:
 
         # Verify conditions, create hash_key list for aggsig check
         pks: List[G1Element] = []
-        msgs: List[bytes32] = []
+        msgs: List[bytes] = []
         error: Optional[Err] = None
         announcements_in_spend: List[bytes32] = announcements_names_for_npc(npc_list)
         for npc in npc_list:
@@ -329,9 +329,9 @@ class MempoolManager:
                 break
 
             if validate_signature:
-                for pk, message in pkm_pairs_for_conditions_dict(npc.condition_dict, npc.coin_name):
-                    pks.append(pk)
-                    msgs.append(message)
+                npc_pks, npc_msgs = pks_msgs_for_conditions_dict(npc.condition_dict, npc.coin_name)
+                pks.extend(npc_pks)
+                msgs.extend(npc_msgs)
         if error:
             return None, MempoolInclusionStatus.FAILED, error
 
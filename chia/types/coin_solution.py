@@ -1,9 +1,19 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program
-from chia.util.chain_utils import additions_for_solution, announcements_for_solution, announcement_names_for_solution
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.types.condition_with_args import ConditionWithArgs
+from chia.util.condition_tools import (
+    conditions_by_opcode,
+    conditions_for_solution,
+    created_announcement_names_for_conditions_dict,
+    created_announcements_for_conditions_dict,
+    created_outputs_for_conditions_dict,
+)
+from chia.util.errors import Err
+from chia.util.ints import uint64
 from chia.util.streamable import Streamable, streamable
 from chia.types.blockchain_format.sized_bytes import bytes32
 from .announcement import Announcement
@@ -22,11 +32,41 @@ class CoinSolution(Streamable):
     puzzle_reveal: Program
     solution: Program
 
+    def conditions_dict(
+        self,
+    ) -> Tuple[Optional[Err], Optional[Dict[ConditionOpcode, List[ConditionWithArgs]]], uint64]:
+        """
+        Same as conditions_dict_for_solution(self.puzzle_reveal, self.solution), but the puzzle is only run once
+        per CoinSolution. Every call returns a dict of its own.
+        """
+        # CoinSolution is frozen, so the result of the run is kept outside of the dataclass fields. The conditions
+        # are stored as a tuple, so each call gets a fresh dict and fresh lists. The ConditionWithArgs objects in
+        # them (and their vars lists) are shared between calls.
+        result: Optional[Tuple[Optional[Err], Optional[Tuple[ConditionWithArgs, ...]], uint64]]
+        result = self.__dict__.get("_conditions")
+        if result is None:
+            error, conditions_list, cost = conditions_for_solution(self.puzzle_reveal, self.solution)
+            result = (error, None if conditions_list is None else tuple(conditions_list), cost)
+            object.__setattr__(self, "_conditions", result)
+        error, conditions, cost = result
+        if error or conditions is None:
+            return error, None, uint64(0)
+        return None, conditions_by_opcode(list(conditions)), cost
+
     def additions(self) -> List[Coin]:
-        return additions_for_solution(self.coin.name(), self.puzzle_reveal, self.solution)
+        err, dic, cost = self.conditions_dict()
+        if err or dic is None:
+            return []
+        return created_outputs_for_conditions_dict(dic, self.coin.name())
 
     def announcements(self) -> List[Announcement]:
-        return announcements_for_solution(self.coin.name(), self.puzzle_reveal, self.solution)
+        err, dic, cost = self.conditions_dict()
+        if err or dic is None:
+            return []
+        return created_announcements_for_conditions_dict(dic, self.coin.name())
 
     def announcement_names(self) -> List[bytes32]:
-        return announcement_names_for_solution(self.coin.name(), self.puzzle_reveal, self.solution)
+        err, dic, cost = self.conditions_dict()
+        if err or dic is None:
+            return []
+        return created_announcement_names_for_conditions_dict(dic, self.coin.name())
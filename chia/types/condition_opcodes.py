@@ -1,5 +1,5 @@
 import enum
-from typing import Any
+from typing import Any, Dict
 
 
 # See chia/wallet/puzzles/condition_codes.clvm
@@ -44,3 +44,7 @@ class ConditionOpcode(bytes, enum.Enum):
     def from_bytes(cls: Any, blob: bytes) -> Any:
         assert len(blob) == 1
         return cls(blob)
+
+
+# Maps the serialized opcode byte to its ConditionOpcode, so parsers do not have to go through the enum constructor
+OPCODE_TABLE: Dict[bytes, ConditionOpcode] = {opcode.value: opcode for opcode in ConditionOpcode}
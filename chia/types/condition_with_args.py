@@ -10,7 +10,7 @@ from chia.util.streamable import Streamable, streamable
 class ConditionWithArgs(Streamable):
     """
     This structure is used to store parsed CLVM conditions
-    Conditions in CLVM have either format of (opcode, var1) or (opcode, var1, var2)
+    Conditions in CLVM have the format (opcode, var1, var2, ...), vars holds every atom that follows the opcode
     """
 
     opcode: ConditionOpcode
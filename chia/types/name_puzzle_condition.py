@@ -15,8 +15,11 @@ class NPC(Streamable):
     conditions: List[Tuple[ConditionOpcode, List[ConditionWithArgs]]]
 
     @property
-    def condition_dict(self):
-        d: Dict[ConditionOpcode, List[ConditionWithArgs]] = {}
-        for opcode, l in self.conditions:
-            d[opcode] = l
+    def condition_dict(self) -> Dict[ConditionOpcode, List[ConditionWithArgs]]:
+        # NPC is frozen, so the dict only needs to be built once. It is stored outside of the dataclass fields,
+        # and therefore does not take part in serialization, hashing or equality.
+        d = self.__dict__.get("_condition_dict")
+        if d is None:
+            d = dict(self.conditions)
+            object.__setattr__(self, "_condition_dict", d)
         return d
@@ -3,16 +3,25 @@ from pathlib import Path
 from typing import Dict
 
 import colorlog
-from concurrent_log_handler import ConcurrentRotatingFileHandler
 
-from chia.util.path import mkdir, path_from_root
+from chia.util.path import path_from_root
+
+
+# The log_level values accepted in the config, anything else falls back to INFO
+LOG_LEVELS: Dict[str, int] = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
 
 
 def initialize_logging(service_name: str, logging_config: Dict, root_path: Path):
     log_path = path_from_root(root_path, logging_config.get("log_filename", "log/debug.log"))
     log_date_format = "%Y-%m-%dT%H:%M:%S"
 
-    mkdir(str(log_path.parent))
+    log_path.parent.mkdir(parents=True, exist_ok=True)
     file_name_length = 33 - len(service_name)
     if logging_config["log_stdout"]:
         handler = colorlog.StreamHandler()
@@ -28,6 +37,9 @@ def initialize_logging(service_name: str, logging_config: Dict, root_path: Path)
         logger = colorlog.getLogger()
         logger.addHandler(handler)
     else:
+        # Imported here, since it pulls in portalocker and is only needed when logging to a file
+        from concurrent_log_handler import ConcurrentRotatingFileHandler
+
         logger = logging.getLogger()
         handler = ConcurrentRotatingFileHandler(log_path, "a", maxBytes=20 * 1024 * 1024, backupCount=7)
         handler.setFormatter(
@@ -38,20 +50,8 @@ def initialize_logging(service_name: str, logging_config: Dict, root_path: Path)
         )
         logger.addHandler(handler)
 
-    if "log_level" in logging_config:
-        if logging_config["log_level"] == "CRITICAL":
-            logger.setLevel(logging.CRITICAL)
-        elif logging_config["log_level"] == "ERROR":
-            logger.setLevel(logging.ERROR)
-        elif logging_config["log_level"] == "WARNING":
-            logger.setLevel(logging.WARNING)
-        elif logging_config["log_level"] == "INFO":
-            logger.setLevel(logging.INFO)
-        elif logging_config["log_level"] == "DEBUG":
-            logger.setLevel(logging.DEBUG)
-            logging.getLogger("aiosqlite").setLevel(logging.INFO)  # Too much logging on debug level
-            logging.getLogger("websockets").setLevel(logging.INFO)  # Too much logging on debug level
-        else:
-            logger.setLevel(logging.INFO)
-    else:
-        logger.setLevel(logging.INFO)
+    level = LOG_LEVELS.get(logging_config.get("log_level", "INFO"), logging.INFO)
+    logger.setLevel(level)
+    if level == logging.DEBUG:
+        logging.getLogger("aiosqlite").setLevel(logging.INFO)  # Too much logging on debug level
+        logging.getLogger("websockets").setLevel(logging.INFO)  # Too much logging on debug level
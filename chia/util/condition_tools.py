@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from blspy import G1Element
 
@@ -6,33 +8,13 @@ from chia.types.announcement import Announcement
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.types.condition_opcodes import ConditionOpcode
+from chia.types.condition_opcodes import OPCODE_TABLE, ConditionOpcode
 from chia.types.condition_with_args import ConditionWithArgs
-from chia.util.clvm import int_from_bytes
 from chia.util.errors import ConsensusError, Err
+from chia.util.hash import std_hash
 from chia.util.ints import uint64
 
 
-def parse_sexp_to_condition(
-    sexp: Program,
-) -> Tuple[Optional[Err], Optional[ConditionWithArgs]]:
-    """
-    Takes a ChiaLisp sexp and returns a ConditionWithArgs.
-    If it fails, returns an Error
-    """
-    as_atoms = sexp.as_atom_list()
-    if len(as_atoms) < 1:
-        return Err.INVALID_CONDITION, None
-    opcode = as_atoms[0]
-    try:
-        opcode = ConditionOpcode(opcode)
-    except ValueError:
-        # TODO: this remapping is bad, and should probably not happen
-        # it's simple enough to just store the opcode as a byte
-        opcode = ConditionOpcode.UNKNOWN
-    return None, ConditionWithArgs(opcode, as_atoms[1:])
-
-
 def parse_sexp_to_conditions(
     sexp: Program,
 ) -> Tuple[Optional[Err], Optional[List[ConditionWithArgs]]]:
@@ -41,12 +23,17 @@ def parse_sexp_to_conditions(
     If it fails, returns as Error
     """
     results: List[ConditionWithArgs] = []
+    append = results.append
+    opcode_table = OPCODE_TABLE
+    unknown = ConditionOpcode.UNKNOWN
     try:
         for _ in sexp.as_iter():
-            error, cvp = parse_sexp_to_condition(_)
-            if error:
-                return error, None
-            results.append(cvp)  # type: ignore # noqa
+            as_atoms = _.as_atom_list()
+            if len(as_atoms) < 1:
+                return Err.INVALID_CONDITION, None
+            # TODO: this remapping of unknown opcodes is bad, and should probably not happen
+            # it's simple enough to just store the opcode as a byte
+            append(ConditionWithArgs(opcode_table.get(as_atoms[0], unknown), as_atoms[1:]))
     except ConsensusError:
         return Err.INVALID_CONDITION, None
     return None, results
@@ -58,55 +45,71 @@ def conditions_by_opcode(
     """
     Takes a list of ConditionWithArgss(CVP) and return dictionary of CVPs keyed of their opcode
     """
-    d: Dict[ConditionOpcode, List[ConditionWithArgs]] = {}
+    d: Dict[ConditionOpcode, List[ConditionWithArgs]] = defaultdict(list)
     cvp: ConditionWithArgs
     for cvp in conditions:
-        if cvp.opcode not in d:
-            d[cvp.opcode] = list()
         d[cvp.opcode].append(cvp)
-    return d
+    return dict(d)
 
 
-def pkm_pairs_for_conditions_dict(
+@lru_cache(maxsize=4096)
+def _g1_from_bytes(raw: bytes) -> G1Element:
+    # The same farmer, pool and wallet keys show up in many conditions, so keep their decompressed form around
+    return G1Element.from_bytes(raw)
+
+
+def pks_msgs_for_conditions_dict(
     conditions_dict: Dict[ConditionOpcode, List[ConditionWithArgs]],
     coin_name: bytes32,
-) -> List[Tuple[G1Element, bytes]]:
-    ret: List[Tuple[G1Element, bytes]] = []
+) -> Tuple[List[G1Element], List[bytes]]:
+    """
+    Returns the public keys and messages of the AGG_SIG and AGG_SIG_ME conditions as two parallel lists,
+    ready to be passed (or extended) into AugSchemeMPL.aggregate_verify
+    """
+    pks: List[G1Element] = []
+    msgs: List[bytes] = []
     for cvp in conditions_dict.get(ConditionOpcode.AGG_SIG, []):
         # TODO: check types
         # assert len(_) == 3
         assert cvp.vars[1] is not None
-        ret.append((G1Element.from_bytes(cvp.vars[0]), cvp.vars[1]))
+        pks.append(_g1_from_bytes(bytes(cvp.vars[0])))
+        msgs.append(cvp.vars[1])
     if coin_name is not None:
         for cvp in conditions_dict.get(ConditionOpcode.AGG_SIG_ME, []):
-            ret.append((G1Element.from_bytes(cvp.vars[0]), cvp.vars[1] + coin_name))
-    return ret
+            # blspy only takes complete messages, so the coin name has to be appended here rather than in the verifier
+            pks.append(_g1_from_bytes(bytes(cvp.vars[0])))
+            msgs.append(cvp.vars[1] + coin_name)
+    return pks, msgs
+
+
+def pkm_pairs_for_conditions_dict(
+    conditions_dict: Dict[ConditionOpcode, List[ConditionWithArgs]],
+    coin_name: bytes32,
+) -> List[Tuple[G1Element, bytes]]:
+    pks, msgs = pks_msgs_for_conditions_dict(conditions_dict, coin_name)
+    return list(zip(pks, msgs))
 
 
 def aggsig_in_conditions_dict(
     conditions_dict: Dict[ConditionOpcode, List[ConditionWithArgs]]
 ) -> List[ConditionWithArgs]:
-    agg_sig_conditions = []
-    for _ in conditions_dict.get(ConditionOpcode.AGG_SIG, []):
-        agg_sig_conditions.append(_)
-    return agg_sig_conditions
+    return list(conditions_dict.get(ConditionOpcode.AGG_SIG, []))
 
 
 def created_outputs_for_conditions_dict(
     conditions_dict: Dict[ConditionOpcode, List[ConditionWithArgs]],
     input_coin_name: bytes32,
 ) -> List[Coin]:
-    output_coins = []
-    for cvp in conditions_dict.get(ConditionOpcode.CREATE_COIN, []):
-        # TODO: check condition very carefully
-        # (ensure there are the correct number and type of parameters)
-        # maybe write a type-checking framework for conditions
-        # and don't just fail with asserts
-        puzzle_hash, amount_bin = cvp.vars[0], cvp.vars[1]
-        amount = int_from_bytes(amount_bin)
-        coin = Coin(input_coin_name, puzzle_hash, amount)
-        output_coins.append(coin)
-    return output_coins
+    # TODO: check condition very carefully
+    # (ensure there are the correct number and type of parameters)
+    # maybe write a type-checking framework for conditions
+    # and don't just fail with asserts
+    # int.from_bytes is the same conversion as clvm's int_from_bytes (empty bytes are 0), minus the wrapper call
+    from_bytes = int.from_bytes
+    return [
+        Coin(input_coin_name, cvp.vars[0], uint64(from_bytes(cvp.vars[1], "big", signed=True)))
+        for cvp in conditions_dict.get(ConditionOpcode.CREATE_COIN, [])
+    ]
 
 
 def created_announcements_for_conditions_dict(
@@ -125,22 +128,37 @@ def created_announcements_for_conditions_dict(
     return output_announcements
 
 
+def announcement_names(pairs: Iterable[Tuple[bytes32, bytes]]) -> List[bytes32]:
+    """
+    Takes (origin coin name, message) pairs and returns the name of each of the corresponding Announcements,
+    hashing them in one pass without constructing Announcement objects
+    """
+    return [std_hash(origin + message) for origin, message in pairs]
+
+
 def announcements_names_for_npc(npc_list) -> List[bytes32]:
-    announcement_names: List[bytes32] = []
+    pairs: List[Tuple[bytes32, bytes]] = []
+    # Hoisted out of the loop, this runs over every condition of every spend in the bundle
+    append = pairs.append
+    create_announcement = ConditionOpcode.CREATE_ANNOUNCEMENT
 
     for npc in npc_list:
-        for coin in created_announcements_for_conditions_dict(npc.condition_dict, npc.coin_name):
-            announcement_names.append(coin.name())
+        for condition, cvp_list in npc.conditions:
+            if condition is not create_announcement:
+                continue
+            for cvp in cvp_list:
+                append((npc.coin_name, cvp.vars[0]))
 
-    return announcement_names
+    return announcement_names(pairs)
 
 
 def created_announcement_names_for_conditions_dict(
     conditions_dict: Dict[ConditionOpcode, List[ConditionWithArgs]],
     input_coin_name: bytes32,
 ) -> List[bytes32]:
-    output = [an.name() for an in created_announcements_for_conditions_dict(conditions_dict, input_coin_name)]
-    return output
+    return announcement_names(
+        (input_coin_name, cvp.vars[0]) for cvp in conditions_dict.get(ConditionOpcode.CREATE_ANNOUNCEMENT, [])
+    )
 
 
 def conditions_dict_for_solution(
@@ -42,19 +42,22 @@ class CoinStore:
 
         announcements: List[Announcement] = []
         conditions_dicts = []
+        coin_names = []
         for coin_solution in spend_bundle.coin_solutions:
             err, conditions_dict, cost = conditions_dict_for_solution(
                 coin_solution.puzzle_reveal, coin_solution.solution
             )
             if conditions_dict is None:
                 raise BadSpendBundleError(f"clvm validation failure {err}")
+            coin_name = coin_solution.coin.name()
+            coin_names.append(coin_name)
             conditions_dicts.append(conditions_dict)
-            announcements.extend(created_announcements_for_conditions_dict(conditions_dict, coin_solution.coin.name()))
+            announcements.extend(created_announcements_for_conditions_dict(conditions_dict, coin_name))
 
-        for coin_solution, conditions_dict in zip(spend_bundle.coin_solutions, conditions_dicts):
+        for coin_name, conditions_dict in zip(coin_names, conditions_dicts):
             prev_transaction_block_height = now.height
             timestamp = now.seconds
-            coin_record = self._db[coin_solution.coin.name()]
+            coin_record = self._db[coin_name]
             err = blockchain_check_conditions_dict(
                 coin_record, announcements, conditions_dict, uint32(prev_transaction_block_height), uint64(timestamp)
             )
@@ -0,0 +1,65 @@
+from chia.types.blockchain_format.coin import Coin
+from chia.types.blockchain_format.program import Program
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.types.coin_solution import CoinSolution
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.util.condition_tools import conditions_dict_for_solution
+from chia.util.errors import Err
+from chia.util.ints import uint64
+
+# The puzzle 1 returns its solution, so the solution is the list of conditions
+IDENTITY_PUZZLE = Program.to(1)
+# (x) raises
+FAILING_PUZZLE = Program.to([8])
+COIN = Coin(bytes32(bytes(32)), IDENTITY_PUZZLE.get_tree_hash(), uint64(1000))
+PUZZLE_HASH = bytes32(bytes([1] * 32))
+
+
+class TestCoinSolution:
+    def test_conditions_dict(self):
+        solution = Program.to(
+            [
+                [ConditionOpcode.CREATE_COIN, PUZZLE_HASH, 500],
+                [ConditionOpcode.CREATE_ANNOUNCEMENT, b"hello"],
+            ]
+        )
+        coin_solution = CoinSolution(COIN, IDENTITY_PUZZLE, solution)
+        expected = conditions_dict_for_solution(IDENTITY_PUZZLE, solution)
+        assert expected[0] is None
+        assert expected[1] is not None
+
+        # The first call runs the puzzle
+        assert "_conditions" not in coin_solution.__dict__
+        first = coin_solution.conditions_dict()
+        assert first == expected
+        assert "_conditions" in coin_solution.__dict__
+
+        # Changing the returned dict or its lists does not change later results
+        assert first[1] is not None
+        first[1][ConditionOpcode.CREATE_COIN].clear()
+        del first[1][ConditionOpcode.CREATE_ANNOUNCEMENT]
+
+        # Later calls come from the stored run
+        second = coin_solution.conditions_dict()
+        assert second == expected
+        assert second[1] is not first[1]
+
+        assert coin_solution.additions() == [Coin(COIN.name(), PUZZLE_HASH, uint64(500))]
+        assert [a.message for a in coin_solution.announcements()] == [b"hello"]
+        assert coin_solution.announcement_names() == [coin_solution.announcements()[0].name()]
+
+        # The stored run is not part of the serialized CoinSolution
+        assert CoinSolution.from_bytes(bytes(coin_solution)) == coin_solution
+        assert "_conditions" not in CoinSolution.from_bytes(bytes(coin_solution)).__dict__
+
+    def test_conditions_dict_error(self):
+        solution = Program.to([])
+        coin_solution = CoinSolution(COIN, FAILING_PUZZLE, solution)
+        expected = conditions_dict_for_solution(FAILING_PUZZLE, solution)
+        assert expected == (Err.SEXP_ERROR, None, uint64(0))
+
+        assert coin_solution.conditions_dict() == expected
+        assert coin_solution.conditions_dict() == expected
+        assert coin_solution.additions() == []
+        assert coin_solution.announcements() == []
+        assert coin_solution.announcement_names() == []
@@ -0,0 +1,55 @@
+from chia.consensus.cost_calculator import CostResult
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.types.condition_with_args import ConditionWithArgs
+from chia.types.name_puzzle_condition import NPC
+from chia.util.ints import uint64
+
+
+def make_npc() -> NPC:
+    create_coin = [ConditionWithArgs(ConditionOpcode.CREATE_COIN, [bytes([1] * 32), bytes([100])])]
+    announcements = [
+        ConditionWithArgs(ConditionOpcode.CREATE_ANNOUNCEMENT, [b"first"]),
+        ConditionWithArgs(ConditionOpcode.CREATE_ANNOUNCEMENT, [b"second"]),
+    ]
+    return NPC(
+        bytes32(bytes([2] * 32)),
+        bytes32(bytes([3] * 32)),
+        [(ConditionOpcode.CREATE_COIN, create_coin), (ConditionOpcode.CREATE_ANNOUNCEMENT, announcements)],
+    )
+
+
+class TestNPC:
+    def test_condition_dict(self):
+        npc = make_npc()
+        d = npc.condition_dict
+        assert d == dict(npc.conditions)
+        assert npc.condition_dict is d
+
+    def test_cached_condition_dict_is_not_serialized(self):
+        npc = make_npc()
+        serialized = bytes(npc)
+        json_dict = npc.to_json_dict()
+        npc_hash = npc.get_hash()
+
+        npc.condition_dict
+
+        assert bytes(npc) == serialized
+        assert npc.to_json_dict() == json_dict
+        assert npc.get_hash() == npc_hash
+        assert npc == make_npc()
+        assert make_npc() == npc
+        assert NPC.from_bytes(serialized) == npc
+
+    def test_process_pool_round_trip(self):
+        # NPCs are sent back from the pre-validation processes inside a serialized CostResult
+        for access_before_serializing in (False, True):
+            npc = make_npc()
+            if access_before_serializing:
+                npc.condition_dict
+            cost_result = CostResult(None, [npc], uint64(1))
+            received = CostResult.from_bytes(bytes(cost_result))
+            assert received == cost_result
+            assert bytes(received.npc_list[0]) == bytes(npc)
+            assert received.npc_list[0].condition_dict == npc.condition_dict
+            assert received.npc_list[0].condition_dict is received.npc_list[0].condition_dict
@@ -0,0 +1,33 @@
+from chia.types.announcement import Announcement
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.types.condition_with_args import ConditionWithArgs
+from chia.types.name_puzzle_condition import NPC
+from chia.util.condition_tools import (
+    announcement_names,
+    announcements_names_for_npc,
+    conditions_by_opcode,
+    created_announcement_names_for_conditions_dict,
+)
+
+
+class TestAnnouncementNames:
+    def test_matches_announcement_name(self):
+        coin_name = bytes32(bytes([1] * 32))
+        other_coin_name = bytes32(bytes([2] * 32))
+        messages = [b"", b"hello", bytes(range(200))]
+        conditions_dict = conditions_by_opcode(
+            [ConditionWithArgs(ConditionOpcode.CREATE_ANNOUNCEMENT, [message]) for message in messages]
+        )
+        expected = [Announcement(coin_name, message).name() for message in messages]
+
+        assert announcement_names([(coin_name, message) for message in messages]) == expected
+        assert created_announcement_names_for_conditions_dict(conditions_dict, coin_name) == expected
+
+        npc_list = [
+            NPC(coin_name, bytes32(bytes(32)), list(conditions_dict.items())),
+            NPC(other_coin_name, bytes32(bytes(32)), list(conditions_dict.items())),
+        ]
+        assert announcements_names_for_npc(npc_list) == expected + [
+            Announcement(other_coin_name, message).name() for message in messages
+        ]